@@ -6,11 +6,11 @@ UI: Streamlit | DB: SQLite
 
 import streamlit as st
 from datetime import datetime, date
-from database import setup_db, get_appointments, get_slots, book_appointment
+from database import setup_db, get_appointments, get_slots, book_appointment, AVAILABLE_SLOTS
 from llm import get_llm_response
 from config import (
     CLINIC_NAME, DOCTOR_NAME, CLINIC_LOCATION, CLINIC_PHONE,
-    CLINIC_HOURS, FIRST_VISIT_FEE, FOLLOWUP_FEE, BOT_NAME, AVAILABLE_SLOTS
+    CLINIC_HOURS, FIRST_VISIT_FEE, FOLLOWUP_FEE, BOT_NAME
 )
 
 # ─────────────────────────────────────────────
@@ -139,7 +139,7 @@ def main():
 
         if appts:
             for a in appts:
-                # a = (id, name, phone, age, concern, date, time, status)
+                # a = (id, name, phone, age, concern, date, time, status, created_at, duration)
                 st.markdown(f"""
                 <div class="appt-card">
                     ⏰ <b>{a[6]}</b> &nbsp;|&nbsp; {a[1]}<br>
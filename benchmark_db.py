@@ -0,0 +1,126 @@
+"""
+⏱️  benchmark_db.py — Text vs integer appointment schema
+Run: python benchmark_db.py [rows]
+
+Builds a database in the old TEXT date/time schema, migrates a copy with
+database.setup_db(), then compares date-range scans and index sizes.
+"""
+
+import os
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+import database
+from database import AVAILABLE_SLOTS, to_day
+
+ROWS    = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+QUERIES = 2_000
+SPAN    = 7                      # days per range query
+START   = date(2024, 1, 1)
+DAYS    = 3 * 365
+
+# The pre-migration schema, with an index on the same columns as the new one
+TEXT_SCHEMA = """
+    CREATE TABLE appointments (
+        id         INTEGER PRIMARY KEY AUTOINCREMENT,
+        name       TEXT NOT NULL,
+        phone      TEXT NOT NULL,
+        age        TEXT,
+        concern    TEXT,
+        date       TEXT NOT NULL,
+        time       TEXT NOT NULL,
+        status     TEXT DEFAULT 'confirmed',
+        created_at TEXT
+    );
+"""
+TEXT_INDEX = "CREATE INDEX idx_appointments_day ON appointments (date, time) WHERE status='confirmed'"
+
+
+def _build_text(path, rows):
+    conn = sqlite3.connect(path)
+    conn.executescript(TEXT_SCHEMA)
+    conn.executemany(
+        "INSERT INTO appointments (name,phone,age,concern,date,time,created_at) VALUES (?,?,?,?,?,?,?)",
+        rows
+    )
+    conn.commit()
+    return conn
+
+
+def _build_int(text_path, path):
+    """Migrate a copy of the text database with the real setup_db()"""
+    shutil.copy(text_path, path)
+    database.DB_FILE = path
+    database.setup_db()
+    conn = sqlite3.connect(path)
+    conn.execute("VACUUM")
+    return conn
+
+
+def _index_bytes(path, conn):
+    """Size of the index, measured as file shrinkage after dropping it"""
+    before = os.path.getsize(path)
+    conn.execute("DROP INDEX idx_appointments_day")
+    conn.commit()
+    conn.execute("VACUUM")
+    return before - os.path.getsize(path)
+
+
+def _time(conn, sql, params):
+    t0 = time.perf_counter()
+    n = 0
+    for p in params:
+        n += len(conn.execute(sql, p).fetchall())
+    return time.perf_counter() - t0, n
+
+
+def main():
+    random.seed(42)
+    rows = [(f"Patient {i}", f"98{i:08d}", str(random.randint(18, 70)), "Diet Consultation",
+             (START + timedelta(random.randrange(DAYS))).isoformat(), random.choice(AVAILABLE_SLOTS),
+             "2024-01-01T10:00:00")
+            for i in range(ROWS)]
+    ranges = [((START + timedelta(s)).isoformat(), (START + timedelta(s + SPAN - 1)).isoformat())
+              for s in (random.randrange(DAYS - SPAN) for _ in range(QUERIES))]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        text_db, int_db = os.path.join(tmp, "text.db"), os.path.join(tmp, "int.db")
+        text = _build_text(text_db, rows)
+        ints = _build_int(text_db, int_db)
+        text.execute(TEXT_INDEX)
+        text.commit()
+        text.execute("VACUUM")
+
+        text_t, text_n = _time(
+            text,
+            "SELECT id, date, time FROM appointments WHERE status='confirmed' "
+            "AND date BETWEEN ? AND ? ORDER BY date, time",
+            ranges
+        )
+        int_t, int_n = _time(
+            ints,
+            "SELECT id, day, start_min FROM appointments WHERE status='confirmed' "
+            "AND day BETWEEN ? AND ? ORDER BY day, start_min",
+            [(to_day(a), to_day(b)) for a, b in ranges]
+        )
+        assert text_n == int_n, "schemas returned different row counts"
+
+        text_size, int_size = os.path.getsize(text_db), os.path.getsize(int_db)
+        text_idx, int_idx = _index_bytes(text_db, text), _index_bytes(int_db, ints)
+        text.close()
+        ints.close()
+
+    print(f"📊 {ROWS:,} appointments, {QUERIES:,} × {SPAN}-day range scans\n")
+    print(f"{'':18}{'TEXT':>12}{'INTEGER':>12}")
+    print(f"{'range scans (s)':18}{text_t:>12.3f}{int_t:>12.3f}")
+    print(f"{'database (KiB)':18}{text_size / 1024:>12.0f}{int_size / 1024:>12.0f}")
+    print(f"{'index (KiB)':18}{text_idx / 1024:>12.0f}{int_idx / 1024:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
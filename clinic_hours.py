@@ -0,0 +1,19 @@
+"""
+🕐  clinic_hours.py — Opening hours & appointment slots (edit here!)
+Kept free of streamlit so database.py can be imported on its own.
+"""
+
+# ─────────────────────────────────────────────────────────────
+# 📅  APPOINTMENT SLOTS
+# ─────────────────────────────────────────────────────────────
+# Slots are generated from these — see database.generate_slots()
+CLINIC_DAYS   = "Monday to Saturday"
+CLINIC_OPEN   = "10:00 AM"
+CLINIC_CLOSE  = "7:00 PM"
+SLOT_MINUTES  = 60                 # Default appointment length
+BREAKS        = [                  # (start, end) — no bookings may overlap these
+    ("1:00 PM", "2:00 PM"),
+]
+
+# Shown to patients in the app and the LLM prompt — built from the above
+CLINIC_HOURS  = f"{CLINIC_DAYS}, {CLINIC_OPEN} – {CLINIC_CLOSE}"
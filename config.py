@@ -16,6 +16,7 @@ OLLAMA_MODEL   = "llama3"          # After: ollama pull llama3
 
 import streamlit as st
 import os
+from clinic_hours import CLINIC_HOURS
 
 GROQ_API_KEY = st.secrets.get("GROQ_API_KEY", os.getenv("GROQ_API_KEY", ""))               # Paste your free Groq API key here
 GROQ_MODEL     = "llama-3.1-8b-instant"  # Free model on Groq
@@ -32,7 +33,6 @@ SPECIALIZATION  = "Nutritionist & Dietician"
 CLINIC_LOCATION = "45 Green Avenue, Koregaon Park, Pune, Maharashtra"
 CLINIC_PHONE    = "+91 98765 43210"
 CLINIC_EMAIL    = "drpriya@clinic.com"
-CLINIC_HOURS    = "Monday to Saturday, 10:00 AM – 7:00 PM"
 CLOSED_DAYS     = "Sundays and National Holidays"
 
 # ─────────────────────────────────────────────────────────────
@@ -61,11 +61,7 @@ SERVICES = [
 # ─────────────────────────────────────────────────────────────
 # 📅  APPOINTMENT SLOTS
 # ─────────────────────────────────────────────────────────────
-AVAILABLE_SLOTS = [
-    "10:00 AM", "11:00 AM", "12:00 PM",
-    "2:00 PM",  "3:00 PM",  "4:00 PM",
-    "5:00 PM",  "6:00 PM"
-]
+# Opening hours, slot length and breaks are set in clinic_hours.py
 
 # ─────────────────────────────────────────────────────────────
 # 🤖  BOT PERSONA
@@ -1,97 +1,267 @@
 """
 🗄️  database.py — SQLite appointment management (100% free, no setup needed)
+
+Dates are stored as an integer epoch-day and times as minute-of-day, so
+ordering, range scans and overlap checks are plain integer comparisons.
+The public functions still take and return "YYYY-MM-DD" / "10:00 AM" text.
 """
 
 import sqlite3
-from datetime import datetime
+from datetime import date as _date, datetime
+from clinic_hours import CLINIC_OPEN, CLINIC_CLOSE, SLOT_MINUTES, BREAKS
 
 DB_FILE = "clinic_appointments.db"
 
+_EPOCH = _date(1970, 1, 1).toordinal()
+
+# Columns returned to callers — keeps the old row layout:
+# (id, name, phone, age, concern, date, time, status, created_at, duration)
+_COLS = "id, name, phone, age, concern, day, start_min, status, created_at, end_min - start_min"
+
+
+# ─────────────────────────────────────────────
+# 🔢  DATE / TIME ENCODING
+# ─────────────────────────────────────────────
+
+def to_day(date_str):
+    """'2026-10-18' → days since 1970-01-01"""
+    return datetime.strptime(date_str, "%Y-%m-%d").date().toordinal() - _EPOCH
+
+
+def from_day(day):
+    """Days since 1970-01-01 → '2026-10-18'"""
+    return _date.fromordinal(day + _EPOCH).strftime("%Y-%m-%d")
+
+
+def to_minute(time_str):
+    """'2:00 PM' → minutes since midnight (840)"""
+    t = datetime.strptime(time_str.strip().upper(), "%I:%M %p")
+    return t.hour * 60 + t.minute
+
+
+def from_minute(minute):
+    """Minutes since midnight → '2:00 PM'"""
+    h, m = divmod(minute, 60)
+    return f"{(h - 1) % 12 + 1}:{m:02d} {'AM' if h < 12 else 'PM'}"
+
+
+def generate_slots(open_time=CLINIC_OPEN, close_time=CLINIC_CLOSE,
+                   slot_minutes=SLOT_MINUTES, breaks=BREAKS):
+    """Build the list of slot labels from clinic hours, slot length and breaks"""
+    start, close = to_minute(open_time), to_minute(close_time)
+    gaps = [(to_minute(b0), to_minute(b1)) for b0, b1 in breaks]
+    slots = []
+    while start + slot_minutes <= close:
+        end = start + slot_minutes
+        clash = next((g1 for g0, g1 in gaps if start < g1 and end > g0), None)
+        if clash is None:
+            slots.append(from_minute(start))
+            start = end
+        else:
+            start = clash
+    return slots
+
+
+AVAILABLE_SLOTS = generate_slots()
+
+
+def _row(r):
+    """Decode an integer-encoded row back to the text layout callers expect"""
+    return r[:5] + (from_day(r[5]), from_minute(r[6])) + r[7:]
+
+
+def _check_interval(start, duration):
+    """Return an error message if [start, start+duration) can't be booked, else None"""
+    end = start + duration
+    if duration <= 0:
+        return f"❌ Invalid appointment length: {duration} minutes."
+    if end > 24 * 60:
+        return "❌ Appointments can't run past midnight."
+    if start < to_minute(CLINIC_OPEN) or end > to_minute(CLINIC_CLOSE):
+        return f"❌ {from_minute(start)} is outside clinic hours ({CLINIC_OPEN} – {CLINIC_CLOSE})."
+    for b0, b1 in BREAKS:
+        if start < to_minute(b1) and end > to_minute(b0):
+            return f"❌ {from_minute(start)} overlaps the {b0} – {b1} break."
+    return None
+
+
+def _overlap(conn, day, start, end, exclude_id=None):
+    """Return the first confirmed appointment overlapping [start, end) on day"""
+    return conn.execute(
+        "SELECT id FROM appointments WHERE status='confirmed' AND day=? "
+        "AND start_min < ? AND end_min > ? AND id IS NOT ?",
+        (day, end, start, exclude_id)
+    ).fetchone()
+
+
+# ─────────────────────────────────────────────
+# 🏗️  SCHEMA
+# ─────────────────────────────────────────────
 
 def setup_db():
-    """Create tables if they don't exist"""
-    conn = sqlite3.connect(DB_FILE)
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS appointments (
-            id         INTEGER PRIMARY KEY AUTOINCREMENT,
-            name       TEXT NOT NULL,
-            phone      TEXT NOT NULL,
-            age        TEXT,
-            concern    TEXT,
-            date       TEXT NOT NULL,
-            time       TEXT NOT NULL,
-            status     TEXT DEFAULT 'confirmed',
-            created_at TEXT
-        )
-    """)
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS patients (
-            id         INTEGER PRIMARY KEY AUTOINCREMENT,
-            name       TEXT,
-            phone      TEXT UNIQUE,
-            age        TEXT,
-            email      TEXT,
-            notes      TEXT,
-            created_at TEXT
-        )
-    """)
-    conn.commit()
-    conn.close()
+    """Create tables if they don't exist, migrating the old text schema"""
+    # Autocommit mode so the explicit BEGIN below also covers the DDL;
+    # IMMEDIATE takes the write lock up front so concurrent sessions queue
+    # behind the schema check instead of deadlocking on the rename
+    conn = sqlite3.connect(DB_FILE, isolation_level=None)
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        cols = [c[1] for c in conn.execute("PRAGMA table_info(appointments)")]
+        if "date" in cols:
+            conn.execute("ALTER TABLE appointments RENAME TO appointments_text")
+
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS appointments (
+                id         INTEGER PRIMARY KEY AUTOINCREMENT,
+                name       TEXT NOT NULL,
+                phone      TEXT NOT NULL,
+                age        TEXT,
+                concern    TEXT,
+                day        INTEGER NOT NULL,
+                start_min  INTEGER NOT NULL,
+                end_min    INTEGER NOT NULL,
+                status     TEXT DEFAULT 'confirmed',
+                created_at TEXT
+            )
+        """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_appointments_day
+            ON appointments (day, start_min) WHERE status='confirmed'
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS patients (
+                id         INTEGER PRIMARY KEY AUTOINCREMENT,
+                name       TEXT,
+                phone      TEXT UNIQUE,
+                age        TEXT,
+                email      TEXT,
+                notes      TEXT,
+                created_at TEXT
+            )
+        """)
+
+        if "date" in cols:
+            old = conn.execute(
+                "SELECT id, name, phone, age, concern, date, time, status, created_at FROM appointments_text"
+            ).fetchall()
+            bad = []
+            for r in old:
+                try:
+                    day, start = to_day(r[5]), to_minute(r[6])
+                except ValueError:
+                    bad.append(r[0])
+                    print(f"⚠️  Appointment #{r[0]} has unreadable date/time {r[5]!r} {r[6]!r} "
+                          "— moved to appointments_unmigrated")
+                    continue
+                conn.execute(
+                    "INSERT INTO appointments (id,name,phone,age,concern,day,start_min,end_min,status,created_at) "
+                    "VALUES (?,?,?,?,?,?,?,?,?,?)",
+                    r[:5] + (day, start, start + SLOT_MINUTES) + r[7:]
+                )
+            if bad:
+                # Keep rows we couldn't convert so they can be fixed by hand
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS appointments_unmigrated AS "
+                    "SELECT * FROM appointments_text WHERE 0"
+                )
+                conn.execute(
+                    f"INSERT INTO appointments_unmigrated SELECT * FROM appointments_text "
+                    f"WHERE id IN ({','.join('?' * len(bad))})",
+                    bad
+                )
+            conn.execute("DROP TABLE appointments_text")
+
+        conn.execute("COMMIT")
+    except Exception:
+        # Leaves the old table untouched if the migration fails part-way
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        raise
+    finally:
+        conn.close()
 
 
-def book_appointment(name, phone, age, concern, date, time):
+# ─────────────────────────────────────────────
+# 📅  APPOINTMENTS
+# ─────────────────────────────────────────────
+
+def book_appointment(name, phone, age, concern, date, time, duration=SLOT_MINUTES):
     """Save a new appointment"""
-    conn = sqlite3.connect(DB_FILE)
-    # Check if slot is already taken
-    taken = conn.execute(
-        "SELECT id FROM appointments WHERE date=? AND time=? AND status='confirmed'",
-        (date, time)
-    ).fetchone()
+    try:
+        day, start = to_day(date), to_minute(time)
+    except ValueError:
+        return False, f"❌ Invalid date or time: {date} {time}"
 
-    if taken:
+    error = _check_interval(start, duration)
+    if error:
+        return False, error
+
+    conn = sqlite3.connect(DB_FILE)
+    # Check if any booked appointment overlaps this one
+    if _overlap(conn, day, start, start + duration):
         conn.close()
         return False, f"❌ Slot {time} on {date} is already booked. Please choose another time."
 
     conn.execute(
-        "INSERT INTO appointments (name,phone,age,concern,date,time,created_at) VALUES (?,?,?,?,?,?,?)",
-        (name, phone, age, concern, date, time, datetime.now().isoformat())
+        "INSERT INTO appointments (name,phone,age,concern,day,start_min,end_min,created_at) VALUES (?,?,?,?,?,?,?,?)",
+        (name, phone, age, concern, day, start, start + duration, datetime.now().isoformat())
     )
     conn.commit()
     conn.close()
     return True, f"✅ Appointment confirmed for {name} on {date} at {time}!"
 
 
-def get_appointments(date=None):
-    """Get all appointments, optionally filtered by date"""
+def get_appointments(date=None, end_date=None):
+    """Get all appointments, optionally filtered by date (or date range)"""
+    if date:
+        try:
+            first, last = to_day(date), to_day(end_date or date)
+        except ValueError:
+            return []
     conn = sqlite3.connect(DB_FILE)
     if date:
         rows = conn.execute(
-            "SELECT * FROM appointments WHERE date=? AND status='confirmed' ORDER BY time",
-            (date,)
+            f"SELECT {_COLS} FROM appointments WHERE status='confirmed' AND day BETWEEN ? AND ? "
+            "ORDER BY day, start_min",
+            (first, last)
         ).fetchall()
     else:
         rows = conn.execute(
-            "SELECT * FROM appointments WHERE status='confirmed' ORDER BY date, time"
+            f"SELECT {_COLS} FROM appointments WHERE status='confirmed' ORDER BY day, start_min"
         ).fetchall()
     conn.close()
-    return rows
+    return [_row(r) for r in rows]
 
 
-def get_slots(date, all_slots):
+def get_slots(date, all_slots, duration=SLOT_MINUTES):
     """Return list of available (unbooked) slots for a date"""
+    try:
+        day = to_day(date)
+    except ValueError:
+        return []
     conn = sqlite3.connect(DB_FILE)
-    booked = [r[0] for r in conn.execute(
-        "SELECT time FROM appointments WHERE date=? AND status='confirmed'", (date,)
-    ).fetchall()]
+    booked = conn.execute(
+        "SELECT start_min, end_min FROM appointments WHERE status='confirmed' AND day=?",
+        (day,)
+    ).fetchall()
     conn.close()
-    return [s for s in all_slots if s not in booked]
+    free = []
+    for s in all_slots:
+        start = to_minute(s)
+        # Same rules as book_appointment: hours, breaks, then other bookings
+        if _check_interval(start, duration):
+            continue
+        if not any(start < b1 and start + duration > b0 for b0, b1 in booked):
+            free.append(s)
+    return free
 
 
 def cancel_appointment(name, phone):
     """Cancel appointment by patient name and phone"""
     conn = sqlite3.connect(DB_FILE)
     appt = conn.execute(
-        "SELECT * FROM appointments WHERE name=? AND phone=? AND status='confirmed' ORDER BY date DESC LIMIT 1",
+        f"SELECT {_COLS} FROM appointments WHERE name=? AND phone=? AND status='confirmed' "
+        "ORDER BY day DESC, start_min DESC LIMIT 1",
         (name, phone)
     ).fetchone()
 
@@ -99,6 +269,7 @@ def cancel_appointment(name, phone):
         conn.close()
         return False, "❌ No confirmed appointment found for this name and phone number."
 
+    appt = _row(appt)
     conn.execute(
         "UPDATE appointments SET status='cancelled' WHERE id=?", (appt[0],)
     )
@@ -108,10 +279,16 @@ def cancel_appointment(name, phone):
 
 
 def reschedule_appointment(name, phone, new_date, new_time):
-    """Reschedule an existing appointment"""
+    """Reschedule an existing appointment (keeps its duration)"""
+    try:
+        day, start = to_day(new_date), to_minute(new_time)
+    except ValueError:
+        return False, f"❌ Invalid date or time: {new_date} {new_time}"
+
     conn = sqlite3.connect(DB_FILE)
     appt = conn.execute(
-        "SELECT * FROM appointments WHERE name=? AND phone=? AND status='confirmed' ORDER BY date DESC LIMIT 1",
+        "SELECT id, end_min - start_min FROM appointments WHERE name=? AND phone=? AND status='confirmed' "
+        "ORDER BY day DESC, start_min DESC LIMIT 1",
         (name, phone)
     ).fetchone()
 
@@ -119,19 +296,19 @@ def reschedule_appointment(name, phone, new_date, new_time):
         conn.close()
         return False, "❌ No confirmed appointment found."
 
-    # Check new slot availability
-    taken = conn.execute(
-        "SELECT id FROM appointments WHERE date=? AND time=? AND status='confirmed'",
-        (new_date, new_time)
-    ).fetchone()
+    error = _check_interval(start, appt[1])
+    if error:
+        conn.close()
+        return False, error
 
-    if taken:
+    # Check new slot availability (ignoring the appointment being moved)
+    if _overlap(conn, day, start, start + appt[1], exclude_id=appt[0]):
         conn.close()
         return False, f"❌ Slot {new_time} on {new_date} is already taken."
 
     conn.execute(
-        "UPDATE appointments SET date=?, time=? WHERE id=?",
-        (new_date, new_time, appt[0])
+        "UPDATE appointments SET day=?, start_min=?, end_min=? WHERE id=?",
+        (day, start, start + appt[1], appt[0])
     )
     conn.commit()
     conn.close()
@@ -142,7 +319,7 @@ def get_patient_history(phone):
     """Get all past appointments for a patient"""
     conn = sqlite3.connect(DB_FILE)
     rows = conn.execute(
-        "SELECT * FROM appointments WHERE phone=? ORDER BY date DESC", (phone,)
+        f"SELECT {_COLS} FROM appointments WHERE phone=? ORDER BY day DESC, start_min DESC", (phone,)
     ).fetchall()
     conn.close()
-    return rows
+    return [_row(r) for r in rows]
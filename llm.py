@@ -8,8 +8,9 @@ from config import (
     GEMINI_API_KEY, GEMINI_MODEL, CLINIC_NAME, DOCTOR_NAME,
     CLINIC_LOCATION, CLINIC_PHONE, CLINIC_EMAIL, CLINIC_HOURS,
     CLOSED_DAYS, SERVICES, FIRST_VISIT_FEE, FOLLOWUP_FEE,
-    ONLINE_FEE, BOT_NAME, BOT_PERSONALITY, AVAILABLE_SLOTS
+    ONLINE_FEE, BOT_NAME, BOT_PERSONALITY
 )
+from database import AVAILABLE_SLOTS
 
 SERVICES_STR = "\n".join(f"  - {s}" for s in SERVICES)
 SLOTS_STR    = ", ".join(AVAILABLE_SLOTS)
@@ -0,0 +1,15 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database  # noqa: E402
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """A fresh, empty database file per test"""
+    monkeypatch.setattr(database, "DB_FILE", str(tmp_path / "clinic.db"))
+    return database.DB_FILE
@@ -0,0 +1,240 @@
+import sqlite3
+import threading
+
+import pytest
+
+import database
+from database import (
+    AVAILABLE_SLOTS, book_appointment, cancel_appointment, generate_slots,
+    get_appointments, get_patient_history, get_slots, reschedule_appointment,
+    setup_db, to_day,
+)
+
+DAY = "2026-10-19"
+
+OLD_SCHEMA = """
+    CREATE TABLE appointments (
+        id         INTEGER PRIMARY KEY AUTOINCREMENT,
+        name       TEXT NOT NULL,
+        phone      TEXT NOT NULL,
+        age        TEXT,
+        concern    TEXT,
+        date       TEXT NOT NULL,
+        time       TEXT NOT NULL,
+        status     TEXT DEFAULT 'confirmed',
+        created_at TEXT
+    )
+"""
+
+
+def _old_db(path, rows):
+    conn = sqlite3.connect(path)
+    conn.execute(OLD_SCHEMA)
+    conn.executemany(
+        "INSERT INTO appointments (name,phone,date,time,status) VALUES (?,?,?,?,?)", rows
+    )
+    conn.commit()
+    conn.close()
+
+
+def _columns(path, table):
+    conn = sqlite3.connect(path)
+    cols = [c[1] for c in conn.execute(f"PRAGMA table_info({table})")]
+    conn.close()
+    return cols
+
+
+# ── Migration ────────────────────────────────
+
+def test_migrates_text_rows_to_integer_rows(db):
+    _old_db(db, [
+        ("Asha", "1", DAY, "5:00 PM", "confirmed"),
+        ("Ravi", "2", DAY, "10:00 AM", "confirmed"),
+        ("Neha", "3", DAY, "2:00 PM", "cancelled"),
+    ])
+    setup_db()
+    setup_db()  # second run is a no-op
+
+    conn = sqlite3.connect(db)
+    rows = conn.execute(
+        "SELECT id, day, start_min, end_min, status FROM appointments ORDER BY id"
+    ).fetchall()
+    conn.close()
+    assert rows == [
+        (1, to_day(DAY), 17 * 60, 18 * 60, "confirmed"),
+        (2, to_day(DAY), 10 * 60, 11 * 60, "confirmed"),
+        (3, to_day(DAY), 14 * 60, 15 * 60, "cancelled"),
+    ]
+    # Chronological, not lexicographic ("10:00 AM" < "5:00 PM")
+    assert [a[6] for a in get_appointments(DAY)] == ["10:00 AM", "5:00 PM"]
+
+
+def test_unreadable_rows_moved_aside(db, capsys):
+    _old_db(db, [
+        ("Asha", "1", DAY, "10:00 AM", "confirmed"),
+        ("Ravi", "2", DAY, "10:00AM", "confirmed"),
+    ])
+    setup_db()
+
+    assert [a[1] for a in get_appointments(DAY)] == ["Asha"]
+    conn = sqlite3.connect(db)
+    assert conn.execute("SELECT id, time FROM appointments_unmigrated").fetchall() == [(2, "10:00AM")]
+    conn.close()
+    assert _columns(db, "appointments_text") == []
+    assert "#2" in capsys.readouterr().out
+
+
+def test_failed_migration_leaves_old_table_intact(db, monkeypatch):
+    _old_db(db, [
+        ("Asha", "1", DAY, "10:00 AM", "confirmed"),
+        ("Ravi", "2", DAY, "11:00 AM", "confirmed"),
+    ])
+
+    def boom(_):
+        raise RuntimeError("disk on fire")
+    monkeypatch.setattr(database, "to_day", boom)
+    with pytest.raises(RuntimeError):
+        setup_db()
+
+    assert "date" in _columns(db, "appointments")
+    assert _columns(db, "appointments_text") == []
+    conn = sqlite3.connect(db)
+    assert conn.execute("SELECT COUNT(*) FROM appointments").fetchone() == (2,)
+    conn.close()
+
+
+def test_concurrent_setup_does_not_lock(tmp_path, monkeypatch):
+    # Two app sessions starting together both run setup_db() on a legacy file
+    for i in range(10):
+        path = str(tmp_path / f"clinic{i}.db")
+        monkeypatch.setattr(database, "DB_FILE", path)
+        _old_db(path, [("Asha", "1", DAY, "10:00 AM", "confirmed")])
+
+        barrier, errors = threading.Barrier(2), []
+
+        def run():
+            barrier.wait()
+            try:
+                setup_db()
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=run) for _ in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert errors == []
+        assert [a[1] for a in get_appointments(DAY)] == ["Asha"]
+
+
+# ── Booking rules ────────────────────────────
+
+def test_back_to_back_bookings_allowed(db):
+    setup_db()
+    assert book_appointment("A", "1", "", "", DAY, "10:00 AM")[0]
+    assert book_appointment("B", "2", "", "", DAY, "11:00 AM")[0]
+
+
+def test_overlapping_booking_rejected(db):
+    setup_db()
+    assert book_appointment("A", "1", "", "", DAY, "10:00 AM")[0]
+    ok, msg = book_appointment("B", "2", "", "", DAY, "10:30 AM", duration=30)
+    assert not ok and msg.startswith("❌")
+    assert "10:00 AM" not in get_slots(DAY, AVAILABLE_SLOTS)
+
+
+@pytest.mark.parametrize("duration", [0, -30])
+def test_non_positive_duration_rejected(db, duration):
+    setup_db()
+    ok, msg = book_appointment("A", "1", "", "", DAY, "11:00 AM", duration=duration)
+    assert not ok and msg.startswith("❌")
+    assert get_appointments(DAY) == []
+
+
+@pytest.mark.parametrize("time, duration", [
+    ("12:30 PM", 90),   # runs into the 1:00 – 2:00 PM break
+    ("1:30 PM", 30),    # inside the break
+    ("9:00 AM", 60),    # before opening
+    ("6:30 PM", 60),    # past closing
+    ("11:00 PM", 120),  # past midnight
+])
+def test_booking_outside_hours_or_in_break_rejected(db, time, duration):
+    setup_db()
+    ok, msg = book_appointment("A", "1", "", "", DAY, time, duration=duration)
+    assert not ok and msg.startswith("❌")
+
+
+def test_reschedule_checks_hours_and_breaks(db):
+    setup_db()
+    assert book_appointment("A", "1", "", "", DAY, "10:00 AM", duration=90)[0]
+    assert not reschedule_appointment("A", "1", DAY, "12:30 PM")[0]
+    assert not reschedule_appointment("A", "1", DAY, "6:00 PM")[0]
+    assert reschedule_appointment("A", "1", DAY, "10:30 AM")[0]  # may overlap itself
+
+
+def test_free_slots_for_longer_appointments_are_bookable(db):
+    setup_db()
+    free = get_slots(DAY, AVAILABLE_SLOTS, duration=90)
+    # 12:00 PM runs into the break and 6:00 PM past closing
+    assert free == ["10:00 AM", "11:00 AM", "2:00 PM", "3:00 PM", "4:00 PM", "5:00 PM"]
+    for i, slot in enumerate(free[::2]):
+        ok, msg = book_appointment(f"P{i}", str(i), "", "", DAY, slot, duration=90)
+        assert ok, msg
+    assert get_slots(DAY, AVAILABLE_SLOTS, duration=90) == []
+
+
+def test_appointments_in_date_range(db):
+    setup_db()
+    book_appointment("A", "1", "", "", "2026-10-18", "2:00 PM")
+    book_appointment("B", "2", "", "", "2026-10-19", "10:00 AM")
+    book_appointment("C", "3", "", "", "2026-10-20", "11:00 AM")
+    book_appointment("D", "4", "", "", "2026-10-21", "10:00 AM")
+
+    rows = get_appointments("2026-10-18", "2026-10-20")
+    assert [(a[1], a[5], a[6]) for a in rows] == [
+        ("A", "2026-10-18", "2:00 PM"),
+        ("B", "2026-10-19", "10:00 AM"),
+        ("C", "2026-10-20", "11:00 AM"),
+    ]
+    assert [a[1] for a in get_appointments("2026-10-21")] == ["D"]
+    assert [a[1] for a in get_appointments()] == ["A", "B", "C", "D"]
+
+
+def test_cancel_and_history_return_text(db):
+    setup_db()
+    book_appointment("A", "1", "", "", "2026-10-18", "10:00 AM")
+    book_appointment("A", "1", "", "", DAY, "2:00 PM", duration=30)
+
+    ok, msg = cancel_appointment("A", "1")
+    assert ok and f"{DAY} at 2:00 PM" in msg
+
+    history = get_patient_history("1")
+    assert [(a[5], a[6], a[7], a[9]) for a in history] == [
+        (DAY, "2:00 PM", "cancelled", 30),
+        ("2026-10-18", "10:00 AM", "confirmed", 60),
+    ]
+
+
+def test_invalid_date_returns_empty(db):
+    setup_db()
+    assert get_appointments("not-a-date") == []
+    assert get_slots("not-a-date", AVAILABLE_SLOTS) == []
+
+
+# ── Slot generation ──────────────────────────
+
+def test_default_slots_match_old_list():
+    assert generate_slots("10:00 AM", "7:00 PM", 60, [("1:00 PM", "2:00 PM")]) == [
+        "10:00 AM", "11:00 AM", "12:00 PM",
+        "2:00 PM", "3:00 PM", "4:00 PM",
+        "5:00 PM", "6:00 PM",
+    ]
+
+
+def test_slots_resume_after_misaligned_break():
+    assert generate_slots("9:00 AM", "12:00 PM", 45, [("10:30 AM", "10:45 AM")]) == [
+        "9:00 AM", "9:45 AM", "10:45 AM",
+    ]
+    # A slot that would end past closing is dropped
+    assert generate_slots("9:00 AM", "10:00 AM", 40, []) == ["9:00 AM"]